@@ -4,9 +4,9 @@ import argparse
 import json
 import os
 import sys
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import FrozenSet, Iterable, List, Sequence, Set
 
 from . import __version__
 from .core import ExecutionSettings, normalise_path, process_paths
@@ -15,23 +15,28 @@ from .models import PathResult, ResultStatus, SkipReason
 from .render import create_renderer, make_console
 
 
-def _detect_repo_root(start: Path) -> Path:
-    current = start.resolve()
-    for candidate in (current, *current.parents):
-        if (candidate / ".git").exists():
-            return candidate
-    return current
+def _detect_repo_root(start: str) -> Path:
+    current = os.path.realpath(start)
+    candidate = current
+    while True:
+        if os.path.exists(os.path.join(candidate, ".git")):
+            return Path(candidate)
+        parent = os.path.dirname(candidate)
+        if parent == candidate:
+            return Path(current)
+        candidate = parent
 
 
-def _compute_protected_roots(repo_root: Path) -> Sequence[Path]:
-    roots = {repo_root, Path.home()}
+def _compute_protected_roots(repo_root: Path) -> FrozenSet[str]:
+    home = os.path.expanduser("~")
+    roots = {str(repo_root), home}
     if sys.platform.startswith("win"):
-        anchor = repo_root.anchor or Path.home().anchor
+        anchor = repo_root.anchor or os.path.splitdrive(home)[0] + os.sep
         if anchor:
-            roots.add(Path(anchor))
+            roots.add(anchor)
     else:
-        roots.add(Path("/"))
-    return tuple(roots)
+        roots.add("/")
+    return frozenset(os.path.realpath(root) for root in roots)
 
 
 def _load_paths_from_files(files: Iterable[str]) -> List[str]:
@@ -39,13 +44,13 @@ def _load_paths_from_files(files: Iterable[str]) -> List[str]:
     for file_path in files:
         candidate = Path(file_path)
         try:
-            text = candidate.read_text(encoding="utf-8")
+            with candidate.open(encoding="utf-8") as handle:
+                for line in handle:
+                    stripped = line.strip()
+                    if stripped:
+                        collected.append(stripped)
         except OSError as exc:
             raise ValueError(f"Failed reading {candidate}: {exc}") from exc
-        for line in text.splitlines():
-            stripped = line.strip()
-            if stripped:
-                collected.append(stripped)
     return collected
 
 
@@ -54,13 +59,6 @@ def _load_paths_from_stdin() -> List[str]:
     return [line.strip() for line in data.splitlines() if line.strip()]
 
 
-def _dedupe_paths(paths: Sequence[Path]) -> List[Path]:
-    ordered = OrderedDict()
-    for path in paths:
-        ordered.setdefault(path, None)
-    return list(ordered.keys())
-
-
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="ded",
@@ -96,8 +94,22 @@ def build_parser() -> argparse.ArgumentParser:
         help="Explicitly allow deleting this exact protected root path.",
     )
     parser.add_argument("--workers", type=int, default=None, metavar="INT", help="Number of worker threads to use.")
+    parser.add_argument(
+        "--workers-multiplier",
+        type=int,
+        default=4,
+        metavar="INT",
+        help="Threads per CPU when --workers is not given (2 suits remote filesystems, 4 local disks).",
+    )
     parser.add_argument("--log", dest="log_path", metavar="PATH", help="Write JSONL log to this path.")
     parser.add_argument("--no-log", action="store_true", help="Disable JSONL logging.")
+    parser.add_argument(
+        "--fsync-every",
+        type=int,
+        default=0,
+        metavar="INT",
+        help="Fsync the JSONL log after every INT records (default 0: only when the run ends).",
+    )
     parser.add_argument("--no-rich", action="store_true", help="Disable live Rich UI.")
     parser.add_argument("--json", action="store_true", help="Emit JSON summary to stdout at the end.")
     parser.add_argument("-q", "--quiet", action="store_true", help="Reduce output to essential information.")
@@ -130,28 +142,38 @@ def main(argv: Sequence[str] | None = None) -> int:
     if args.stdin:
         raw_paths.extend(_load_paths_from_stdin())
 
+    cwd = os.getcwd()
     processed_paths: List[Path] = []
     invalid_inputs: List[str] = []
 
-    for raw in raw_paths:
-        try:
-            processed_paths.append(normalise_path(raw))
-        except (ValueError, OSError):
-            invalid_inputs.append(raw)
-
-    if not args.no_dedupe:
-        processed_paths = _dedupe_paths(processed_paths)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Finding the repo root stats every parent of cwd; overlap it with normalisation.
+        repo_future = pool.submit(_detect_repo_root, cwd)
+        # Dedupe while normalising; normcase keeps Windows' case-insensitive matching.
+        seen: Set[str] | None = None if args.no_dedupe else set()
+        for raw in raw_paths:
+            try:
+                path = normalise_path(raw, cwd)
+            except (ValueError, OSError):
+                invalid_inputs.append(raw)
+                continue
+            if seen is not None:
+                key = os.path.normcase(os.fspath(path))
+                if key in seen:
+                    continue
+                seen.add(key)
+            processed_paths.append(path)
+        repo_root = repo_future.result()
 
     if not processed_paths and not invalid_inputs:
         print("ded: error: no valid paths to process", file=sys.stderr)
         return 2
 
-    repo_root = _detect_repo_root(Path.cwd())
     protected_roots = tuple(_compute_protected_roots(repo_root))
-    allow_roots = tuple(normalise_path(str(p)) for p in args.allow_root)
-    restrict_roots = tuple(normalise_path(str(p)) for p in args.restrict_to)
+    allow_roots = tuple(normalise_path(str(p), cwd) for p in args.allow_root)
+    restrict_roots = tuple(normalise_path(str(p), cwd) for p in args.restrict_to)
 
-    worker_count = args.workers or min(32, (os.cpu_count() or 4) * 4)
+    worker_count = args.workers or min(32, (os.cpu_count() or 4) * args.workers_multiplier)
     if worker_count <= 0:
         worker_count = 1
 
@@ -164,20 +186,25 @@ def main(argv: Sequence[str] | None = None) -> int:
     total_paths = len(processed_paths) + len(invalid_inputs)
     renderer = create_renderer(console=console, use_rich=use_rich, total=total_paths, verbosity=verbosity)
 
-    log_context = build_log_context()
+    log_context = build_log_context(cwd)
     logger: JsonlLogger | None = None
     chosen_log_path: Path | None = None
 
     if not args.no_log:
-        chosen_log_path = normalise_path(args.log_path) if args.log_path else default_log_path()
+        fsync_every = max(args.fsync_every, 0)
+        if args.log_path:
+            chosen_log_path = normalise_path(args.log_path, cwd)
+        else:
+            chosen_log_path = default_log_path(cwd=Path(cwd))
         try:
-            logger = JsonlLogger(chosen_log_path)
+            logger = JsonlLogger(chosen_log_path, fsync_every=fsync_every)
             logger.open()
         except OSError:
             fallback = fallback_log_path()
-            logger = JsonlLogger(fallback)
+            logger = JsonlLogger(fallback, fsync_every=fsync_every)
             logger.open()
             chosen_log_path = fallback
+        logger.start_writer()
 
     settings = ExecutionSettings(
         follow_symlinks=args.follow_symlinks,
@@ -192,10 +219,8 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     try:
         with renderer:
-            for idx, path in enumerate(processed_paths):
-                renderer.on_enqueue(idx, path)
-            for idx, raw in enumerate(invalid_inputs, start=len(processed_paths)):
-                renderer.on_enqueue(idx, raw)
+            renderer.on_enqueue_bulk(enumerate(processed_paths))
+            renderer.on_enqueue_bulk(enumerate(invalid_inputs, start=len(processed_paths)))
 
             for idx, raw in enumerate(invalid_inputs, start=len(processed_paths)):
                 dummy = PathResult(
@@ -210,12 +235,12 @@ def main(argv: Sequence[str] | None = None) -> int:
                 )
                 renderer.on_result(dummy)
                 if logger:
-                    logger.write(dummy.to_log_record(**log_context))
+                    logger.write_result(dummy, log_context)
 
             def collect(res: PathResult) -> None:
                 renderer.on_result(res)
                 if logger:
-                    logger.write(res.to_log_record(**log_context))
+                    logger.write_result(res, log_context)
 
             _, totals, elapsed = process_paths(
                 processed_paths,
@@ -2,14 +2,21 @@ from __future__ import annotations
 
 import errno
 import os
+import stat
 import time
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional, Sequence, Tuple
+from typing import Callable, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 from .models import PathResult, ProcessingTotals, ResultStatus, SkipReason
 
+# Below this many paths a thread pool costs more to start than it saves.
+SERIAL_THRESHOLD = 8
+# Futures kept in flight per worker. This bounds pending futures, not results:
+# every PathResult is still collected, so memory grows with the input size.
+IN_FLIGHT_PER_WORKER = 2
+
 
 @dataclass(frozen=True)
 class ExecutionSettings:
@@ -18,75 +25,72 @@ class ExecutionSettings:
     follow_symlinks: bool
     restrict_to: Tuple[Path, ...]
     allow_roots: Tuple[Path, ...]
-    protected_roots: Tuple[Path, ...]
+    protected_roots: Tuple[Union[Path, str], ...]
     repo_root: Path
-
-
-def normalise_path(raw: str) -> Path:
-    """Normalise incoming raw path strings to absolute Paths without forcing symlink resolution."""
-    expanded = os.path.expandvars(raw)
-    expanded = os.path.expanduser(expanded)
-    path = Path(expanded)
-    if not path.is_absolute():
-        joined = os.path.join(os.getcwd(), str(path))
-        return Path(os.path.abspath(joined))
-    return Path(os.path.abspath(str(path)))
-
-
-def _is_protected_root(path: Path, settings: ExecutionSettings) -> bool:
-    path_canonical = _canonical(path)
-    allowed = {_canonical(p) for p in settings.allow_roots}
-    if path_canonical in allowed:
+    _allow_canon: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _protected_canon: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _restrict_prefixes: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Canonicalise the roots once per run rather than once per processed path.
+        protected = {*self.protected_roots, self.repo_root, Path.home()}
+        object.__setattr__(self, "_allow_canon", frozenset(_canonical_key(p) for p in self.allow_roots))
+        object.__setattr__(self, "_protected_canon", frozenset(_canonical_key(p) for p in protected))
+        # Trailing separator so "/foo" does not admit "/foobar".
+        prefixes = tuple(os.path.join(_canonical_key(p), "") for p in self.restrict_to)
+        object.__setattr__(self, "_restrict_prefixes", prefixes)
+
+
+def normalise_path(raw: str, cwd: Optional[str] = None) -> Path:
+    """Normalise incoming raw path strings to absolute Paths without forcing symlink resolution.
+
+    ``cwd`` lets callers normalising many paths look up the working directory once
+    instead of paying a ``getcwd`` per path.
+    """
+    expanded = raw
+    if "$" in expanded or "%" in expanded:
+        expanded = os.path.expandvars(expanded)
+    if expanded.startswith("~"):
+        expanded = os.path.expanduser(expanded)
+    if not os.path.isabs(expanded):
+        expanded = os.path.join(cwd if cwd is not None else os.getcwd(), expanded)
+    return Path(os.path.normpath(expanded))
+
+
+def _is_protected_root(path: Path, settings: ExecutionSettings, key: Optional[str] = None) -> bool:
+    """``key`` is ``path``'s canonical key when the caller has already computed it."""
+    if key is None:
+        key = _canonical_key(path)
+    if key in settings._allow_canon:
         return False
-    protected = {_canonical(p) for p in settings.protected_roots}
-    if path_canonical in protected:
-        return True
-    if path_canonical == _canonical(settings.repo_root):
+    if key in settings._protected_canon:
         return True
-    anchor = Path(path.anchor) if path.anchor else None
-    if anchor and path_canonical == _canonical(anchor):
-        return True
-    home = _canonical(Path.home())
-    if path_canonical == home:
-        return True
-    return False
+    # A filesystem anchor ("/", "C:\\") is its own parent.
+    return os.path.dirname(key) == key
 
 
-def _canonical(path: Path) -> Path:
+def _canonical_key(path: Union[Path, str]) -> str:
+    """Canonical path as a case-normalised string for set and prefix comparisons."""
     try:
-        return path.resolve(strict=False)
+        canonical = os.path.realpath(path)
     except OSError:
-        return Path(os.path.abspath(str(path)))
+        canonical = os.path.abspath(path)
+    return os.path.normcase(canonical)
 
 
-def _is_within_restrict(path: Path, restrict_to: Tuple[Path, ...]) -> bool:
-    if not restrict_to:
+def _is_within_restrict(path: Path, restrict_prefixes: Tuple[str, ...], key: Optional[str] = None) -> bool:
+    if not restrict_prefixes:
         return True
-    path_c = _canonical(path)
-    for root in restrict_to:
-        root_c = _canonical(root)
-        try:
-            if path_c.is_relative_to(root_c):
-                return True
-        except AttributeError:
-            # Python <3.9 fallback
-            try:
-                path_c.relative_to(root_c)
-                return True
-            except ValueError:
-                continue
-    return False
+    if key is None:
+        key = _canonical_key(path)
+    return any(key == prefix[:-1] or key.startswith(prefix) for prefix in restrict_prefixes)
 
 
 def _scan_directory(path: Path) -> Tuple[int, Optional[SkipReason], Optional[str]]:
     """Return entry count limited to first item. If error, return -1 and reason."""
-    entries = 0
     try:
         with os.scandir(path) as it:
-            for _ in it:
-                entries += 1
-                if entries > 0:
-                    break
+            entries = 0 if next(it, None) is None else 1
     except PermissionError as exc:
         return -1, SkipReason.PERMISSION_DENIED, str(exc)
     except FileNotFoundError:
@@ -98,87 +102,53 @@ def _scan_directory(path: Path) -> Tuple[int, Optional[SkipReason], Optional[str
     return entries, None, None
 
 
-def _prepare_target(path: Path, settings: ExecutionSettings) -> Tuple[Path, Optional[Path], bool]:
-    """Return the directory to operate on, optional resolved target for symlinks, and bool is_symlink."""
-    try:
-        is_symlink = path.is_symlink()
-    except OSError:
-        is_symlink = False
-
-    if is_symlink:
-        try:
-            resolved = path.resolve(strict=False)
-        except OSError:
-            resolved = path
-    else:
-        resolved = None
+def _prepare_target(path: Path, st: os.stat_result, settings: ExecutionSettings) -> Tuple[Path, Optional[Path], bool]:
+    """Return the directory to operate on, optional resolved target for symlinks, and bool is_symlink.
 
-    if is_symlink and not settings.follow_symlinks:
-        return path, resolved, True
-    if is_symlink and resolved is not None:
-        return resolved, resolved, True
-    return path, None, False
+    ``st`` is the caller's ``lstat`` of ``path``, reused to avoid restatting it.
+    """
+    if not stat.S_ISLNK(st.st_mode):
+        return path, None, False
+    if not settings.follow_symlinks:
+        return path, None, True
 
+    try:
+        resolved = Path(os.path.realpath(path))
+    except OSError:
+        return path, path, True
+    return resolved, resolved, True
 
-def _evaluate_path(index: int, path: Path, settings: ExecutionSettings) -> PathResult:
-    start = time.perf_counter()
-    result = PathResult(index=index, path=path)
 
+def _lstat_into(result: PathResult, path: Path) -> Optional[os.stat_result]:
+    """Fill exists/is_dir/is_symlink from one lstat; return None if the path cannot be examined."""
     try:
-        path.lstat()
+        st = os.lstat(path)
         result.exists = True
     except FileNotFoundError:
         result.reason = SkipReason.NOT_EXISTS
         result.status = ResultStatus.SKIPPED
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
+        return None
     except OSError as exc:
         result.reason = SkipReason.IO_ERROR
         result.status = ResultStatus.ERROR
         result.message = str(exc)
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    try:
-        result.is_dir = path.is_dir()
-    except OSError:
-        result.is_dir = False
-
-    try:
-        result.is_symlink = path.is_symlink()
-    except OSError:
-        result.is_symlink = False
-
-    if not result.is_dir and not (result.is_symlink and settings.follow_symlinks):
-        result.reason = SkipReason.NOT_DIR
-        result.status = ResultStatus.SKIPPED
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    target, resolved, is_symlink = _prepare_target(path, settings)
-
-    if is_symlink and not settings.follow_symlinks:
-        result.reason = SkipReason.SYMLINK_DIR_REFUSED
-        result.status = ResultStatus.SKIPPED
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
+        return None
 
-    effective_path = target
+    result.is_symlink = stat.S_ISLNK(st.st_mode)
+    if result.is_symlink:
+        # A symlink counts as a directory when its target is one.
+        try:
+            result.is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+        except OSError:
+            result.is_dir = False
+    else:
+        result.is_dir = stat.S_ISDIR(st.st_mode)
+    return st
 
-    if not _is_within_restrict(effective_path, settings.restrict_to):
-        result.reason = SkipReason.POLICY_BLOCKED
-        result.status = ResultStatus.SKIPPED
-        result.message = "Outside allowed restrict-to roots"
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
 
-    if _is_protected_root(effective_path, settings):
-        result.reason = SkipReason.PROTECTED_ROOT
-        result.status = ResultStatus.SKIPPED
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
-
-    entries, reason, message = _scan_directory(effective_path)
+def _remove_if_empty(result: PathResult, target: Path, followed_from: Optional[Path] = None) -> None:
+    """Verify ``target`` is empty and rmdir it; ``followed_from`` is the symlink that led here."""
+    entries, reason, message = _scan_directory(target)
     result.entries_count = entries
     if reason:
         result.reason = reason
@@ -192,23 +162,21 @@ def _evaluate_path(index: int, path: Path, settings: ExecutionSettings) -> PathR
         else:
             result.status = ResultStatus.SKIPPED
         result.message = message
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
+        return
 
     if entries > 0:
         result.reason = SkipReason.NOT_EMPTY
         result.status = ResultStatus.SKIPPED
-        result.duration_ms = (time.perf_counter() - start) * 1000
-        return result
+        return
 
     result.empty_verified = True
 
     try:
-        effective_path.rmdir()
+        target.rmdir()
         result.deleted = True
         result.status = ResultStatus.DELETED
-        if is_symlink and resolved and resolved != path:
-            result.message = f"Deleted symlink target: {resolved}"
+        if followed_from is not None and target != followed_from:
+            result.message = f"Deleted symlink target: {target}"
     except FileNotFoundError:
         result.reason = SkipReason.NOT_EXISTS
         result.exists = False
@@ -225,7 +193,89 @@ def _evaluate_path(index: int, path: Path, settings: ExecutionSettings) -> PathR
         if getattr(exc, "errno", None) == errno.ENOTEMPTY:
             result.message = "Directory not empty at deletion time"
 
-    result.duration_ms = (time.perf_counter() - start) * 1000
+
+def _check_and_delete(result: PathResult, path: Path, settings: ExecutionSettings) -> None:
+    """Validate ``path`` and rmdir it if verified empty, recording the outcome on ``result``."""
+    st = _lstat_into(result, path)
+    if st is None:
+        return
+
+    if not result.is_dir and not (result.is_symlink and settings.follow_symlinks):
+        result.reason = SkipReason.NOT_DIR
+        result.status = ResultStatus.SKIPPED
+        return
+
+    target, resolved, is_symlink = _prepare_target(path, st, settings)
+
+    if is_symlink and not settings.follow_symlinks:
+        result.reason = SkipReason.SYMLINK_DIR_REFUSED
+        result.status = ResultStatus.SKIPPED
+        return
+
+    # A followed target is already resolved; canonicalise everything else once
+    # and share the key between the restrict and protected-root checks.
+    key = os.path.normcase(resolved) if resolved is not None else _canonical_key(target)
+
+    if not _is_within_restrict(target, settings._restrict_prefixes, key):
+        result.reason = SkipReason.POLICY_BLOCKED
+        result.status = ResultStatus.SKIPPED
+        result.message = "Outside allowed restrict-to roots"
+        return
+
+    if _is_protected_root(target, settings, key):
+        result.reason = SkipReason.PROTECTED_ROOT
+        result.status = ResultStatus.SKIPPED
+        return
+
+    _remove_if_empty(result, target, followed_from=path if resolved is not None else None)
+
+
+def _check_and_delete_plain(result: PathResult, path: Path, settings: ExecutionSettings) -> None:
+    """``_check_and_delete`` specialised for runs without --restrict-to or --follow-symlinks.
+
+    Every symlink is refused in this mode, so no target preparation or subtree
+    policy is needed; the protected-root guard still applies.
+    """
+    if _lstat_into(result, path) is None:
+        return
+
+    if not result.is_dir:
+        result.reason = SkipReason.NOT_DIR
+        result.status = ResultStatus.SKIPPED
+        return
+
+    if result.is_symlink:
+        result.reason = SkipReason.SYMLINK_DIR_REFUSED
+        result.status = ResultStatus.SKIPPED
+        return
+
+    if _is_protected_root(path, settings):
+        result.reason = SkipReason.PROTECTED_ROOT
+        result.status = ResultStatus.SKIPPED
+        return
+
+    _remove_if_empty(result, path)
+
+
+def _select_check(settings: ExecutionSettings) -> Callable[[PathResult, Path, ExecutionSettings], None]:
+    """Pick the per-path check once per run based on which policies are active."""
+    if not settings.restrict_to and not settings.follow_symlinks:
+        return _check_and_delete_plain
+    return _check_and_delete
+
+
+def _evaluate_path(
+    index: int,
+    path: Path,
+    settings: ExecutionSettings,
+    check: Callable[[PathResult, Path, ExecutionSettings], None] = _check_and_delete,
+) -> PathResult:
+    start = time.perf_counter()
+    result = PathResult(index=index, path=path)
+    try:
+        check(result, path, settings)
+    finally:
+        result.duration_ms = (time.perf_counter() - start) * 1000
     return result
 
 
@@ -247,13 +297,23 @@ def process_paths(
         if callback:
             callback(res)
 
-    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
-        futures: List[Future[PathResult]] = [
-            executor.submit(_evaluate_path, idx, path, settings) for idx, path in enumerate(paths)
-        ]
-        for future in as_completed(futures):
-            res = future.result()
-            handle_result(res)
+    check = _select_check(settings)
+
+    if workers <= 1 or len(paths) < SERIAL_THRESHOLD:
+        for idx, path in enumerate(paths):
+            handle_result(_evaluate_path(idx, path, settings, check))
+    else:
+        window = workers * IN_FLIGHT_PER_WORKER
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: Set[Future[PathResult]] = set()
+            for idx, path in enumerate(paths):
+                pending.add(executor.submit(_evaluate_path, idx, path, settings, check))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        handle_result(future.result())
+            for future in as_completed(pending):
+                handle_result(future.result())
 
     elapsed = time.perf_counter() - start
     return results, totals, elapsed
@@ -2,16 +2,34 @@ from __future__ import annotations
 
 import json
 import os
+import platform
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+from .models import PathResult
 
 try:
     from platformdirs import user_log_dir
 except ImportError:  # pragma: no cover - optional dependency
     user_log_dir = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 DEFAULT_LOG_DIR_NAME = ".project_logs"
+# Process metadata is fixed for the life of the CLI; look it up once.
+_PID = os.getpid()
+_HOSTNAME = platform.node()
+FLUSH_EVERY_RECORDS = 100
+FLUSH_EVERY_BYTES = 64 * 1024
+# Queue marker for a flush request; only the writer thread touches the buffer.
+_FLUSH = object()
 
 
 def default_log_path(now: Optional[datetime] = None, cwd: Optional[Path] = None) -> Path:
@@ -33,12 +51,36 @@ def fallback_log_path(app_name: str = "delete-empty-dirs") -> Path:
     return log_dir / f"empty_delete_{timestamp}.jsonl"
 
 
+def _encode_line(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def encode_record(result: PathResult, context: Mapping[str, Any]) -> bytes:
+    """Encode a result as one newline-terminated JSONL record."""
+    return _encode_line(result.to_log_record(context))
+
+
 class JsonlLogger:
-    """Simple JSONL logger that flushes data to disk for durability."""
+    """JSONL logger that batches writes and syncs to disk on close.
+
+    Records are buffered and written every ``FLUSH_EVERY_RECORDS`` records or
+    ``FLUSH_EVERY_BYTES`` bytes. Pass ``fsync_every=N`` to also fsync after every
+    N records when durability mid-run matters more than throughput. After
+    ``start_writer()`` encoding and file writes happen on a background thread.
+    """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, *, fsync_every: int = 0):
         self.path = path
+        self.fsync_every = fsync_every
         self._fp = None
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._unsynced = 0
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_error: Optional[BaseException] = None
 
     def __enter__(self) -> "JsonlLogger":
         self.open()
@@ -51,26 +93,122 @@ class JsonlLogger:
         if self._fp is not None:
             return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._fp = self.path.open("a", encoding="utf-8")
+        self._fp = self.path.open("ab")
+
+    def start_writer(self) -> None:
+        """Hand records to a background thread instead of writing them inline."""
+        if self._queue is not None:
+            return
+        self.open()
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain_queue, name="jsonl-writer", daemon=True)
+        self._writer.start()
+
+    def _drain_queue(self) -> None:
+        while True:
+            item: Optional[Tuple[Any, tuple]] = self._queue.get()
+            if item is None:
+                return
+            encoder, args = item
+            if encoder is _FLUSH:
+                sync, done = args
+                try:
+                    if self._writer_error is None:
+                        self._flush(sync=sync)
+                except BaseException as exc:
+                    self._writer_error = exc
+                finally:
+                    done.set()
+                continue
+            if self._writer_error is not None:
+                # After a failure records are dropped, but the queue keeps draining
+                # so pending flush requests are answered rather than left waiting.
+                continue
+            try:
+                self._append(encoder(*args))
+            except BaseException as exc:  # surfaced to the caller by write()/flush()/close()
+                self._writer_error = exc
+
+    def _stop_writer(self) -> None:
+        if self._queue is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._queue = None
+        self._writer = None
 
     def write(self, record: dict) -> None:
+        self._submit(_encode_line, record)
+
+    def write_result(self, result: PathResult, context: Mapping[str, Any]) -> None:
+        """Log a result; with a writer running, the record is built and encoded on its thread."""
+        self._submit(encode_record, result, context)
+
+    def _submit(self, encoder: Callable[..., bytes], *args: Any) -> None:
         if self._fp is None:
             raise RuntimeError("Logger not opened")
-        json.dump(record, self._fp, ensure_ascii=False)
-        self._fp.write("\n")
+        if self._writer_error is not None:
+            raise self._writer_error
+        if self._queue is not None:
+            self._queue.put((encoder, args))
+        else:
+            self._append(encoder(*args))
+
+    def _append(self, line: bytes) -> None:
+        self._buffer += line
+        self._buffered += 1
+        self._unsynced += 1
+        if self.fsync_every and self._unsynced >= self.fsync_every:
+            self._flush(sync=True)
+        elif self._buffered >= FLUSH_EVERY_RECORDS or len(self._buffer) >= FLUSH_EVERY_BYTES:
+            self._flush()
+
+    def flush(self, *, sync: bool = False) -> None:
+        """Write buffered records to the file, optionally fsyncing them.
+
+        With a writer running, the flush is queued behind records already
+        submitted and this call waits for the writer thread to perform it.
+        """
+        if self._queue is None:
+            self._flush(sync=sync)
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, (sync, done)))
+        done.wait()
+        if self._writer_error is not None:
+            raise self._writer_error
+
+    def _flush(self, *, sync: bool = False) -> None:
+        if self._fp is None:
+            return
+        if self._buffer:
+            self._fp.write(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
         self._fp.flush()
-        os.fsync(self._fp.fileno())
+        if sync:
+            os.fsync(self._fp.fileno())
+            self._unsynced = 0
 
     def close(self) -> None:
+        self._stop_writer()
         if self._fp:
-            self._fp.close()
-            self._fp = None
-
-
-def build_log_context() -> dict:
-    """Common host/process metadata included with every log record."""
-    return {
-        "pid": os.getpid(),
-        "host": os.uname().nodename,
-        "cwd": str(Path.cwd()),
-    }
+            try:
+                self._flush(sync=True)
+            finally:
+                self._fp.close()
+                self._fp = None
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
+
+
+def build_log_context(cwd: Optional[str] = None) -> Mapping[str, Any]:
+    """Common host/process metadata included with every log record (read-only)."""
+    return MappingProxyType(
+        {
+            "pid": _PID,
+            "host": _HOSTNAME,
+            "cwd": cwd if cwd is not None else str(Path.cwd()),
+        }
+    )
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 
 class ResultStatus(str, Enum):
@@ -29,6 +30,9 @@ class SkipReason(str, Enum):
     INVALID_PATH = "invalid_path"
 
 
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+
 @dataclass(slots=True)
 class PathResult:
     """Structured result emitted for each processed path."""
@@ -45,10 +49,18 @@ class PathResult:
     reason: Optional[SkipReason] = None
     message: Optional[str] = None
     duration_ms: float = 0.0
-    ts: datetime = field(default_factory=datetime.utcnow)
+    # Nanoseconds since the epoch; formatted as ISO8601 only when logged.
+    ts_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def ts(self) -> datetime:
+        return _UNIX_EPOCH + timedelta(microseconds=self.ts_ns // 1000)
 
-    def to_log_record(self, pid: int, host: str, cwd: str) -> dict:
-        """Convert result into JSON-serialisable dict for durable logging."""
+    def to_log_record(self, context: Mapping[str, Any]) -> dict:
+        """Convert result into JSON-serialisable dict for durable logging.
+
+        ``context`` carries the run-wide ``pid``/``host``/``cwd`` fields.
+        """
         return {
             "path": str(self.path),
             "exists": self.exists,
@@ -61,27 +73,37 @@ class PathResult:
             "reason": self.reason.value if self.reason else None,
             "duration_ms": self.duration_ms,
             "ts": self.ts.isoformat() + "Z",
-            "pid": pid,
-            "host": host,
-            "cwd": cwd,
+            **context,
             "message": self.message,
         }
 
 
+_STATUS_INDEX: Dict[ResultStatus, int] = {
+    ResultStatus.DELETED: 0,
+    ResultStatus.ERROR: 1,
+    ResultStatus.SKIPPED: 2,
+}
+
+
 @dataclass(slots=True)
 class ProcessingTotals:
     """Mutable totals for summarising run progress."""
 
     total: int = 0
-    deleted: int = 0
-    skipped: int = 0
-    errors: int = 0
+    counts: List[int] = field(default_factory=lambda: [0, 0, 0])
+
+    @property
+    def deleted(self) -> int:
+        return self.counts[0]
+
+    @property
+    def errors(self) -> int:
+        return self.counts[1]
+
+    @property
+    def skipped(self) -> int:
+        return self.counts[2]
 
     def update(self, result: PathResult) -> None:
         self.total += 1
-        if result.status == ResultStatus.DELETED:
-            self.deleted += 1
-        elif result.status == ResultStatus.ERROR:
-            self.errors += 1
-        else:
-            self.skipped += 1
+        self.counts[_STATUS_INDEX[result.status]] += 1
@@ -1,35 +1,89 @@
 from __future__ import annotations
 
+import functools
+import importlib.util
+import os
 import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Union
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, List, Optional, Tuple, Union
 
-try:
-    from rich import box
-    from rich.console import Console
-    from rich.layout import Layout
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from rich.console import Console, ConsoleOptions, Group, RenderResult
+    from rich.segment import Segment
     from rich.live import Live
     from rich.panel import Panel
-    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
-    from rich.table import Table
-    from rich.text import Text
-
-    HAS_RICH = True
-except ImportError:  # pragma: no cover - optional dependency
-    box = None
-    Console = None  # type: ignore
-    Layout = None  # type: ignore
-    Live = None  # type: ignore
-    Panel = None  # type: ignore
-    Progress = None  # type: ignore
-    Text = None  # type: ignore
-    BarColumn = TextColumn = TimeElapsedColumn = None  # type: ignore
-    HAS_RICH = False
+    from rich.table import Column, Table
+
+# Detect Rich without importing it; plain-output runs never pay for the import.
+HAS_RICH = importlib.util.find_spec("rich") is not None
 
 from .models import PathResult, ResultStatus
 
 
+@functools.lru_cache(maxsize=1)
+def _rich() -> Optional[SimpleNamespace]:
+    """Import the Rich pieces used by RichRenderer on first use."""
+    try:
+        from rich import box
+        from rich.console import Group
+        from rich.live import Live
+        from rich.panel import Panel
+        from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+        from rich.table import Column, Table
+        from rich.text import Text
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return SimpleNamespace(
+        box=box,
+        Group=Group,
+        Live=Live,
+        Panel=Panel,
+        BarColumn=BarColumn,
+        Progress=Progress,
+        TextColumn=TextColumn,
+        TimeElapsedColumn=TimeElapsedColumn,
+        Column=Column,
+        Table=Table,
+        Text=Text,
+    )
+
+
+# Screen lines not available to table rows: header (4), footer (4) and the
+# table's own heading and rules.
+_RESERVED_LINES = 4 + 4 + 4
+
+# Live ticks at _MAX_REFRESH per second. When frames get slow (mean build time
+# over _SLOW_FRAME) the renderer rebuilds on fewer ticks, down to _MIN_REFRESH
+# per second, and speeds back up once frames are cheap again.
+_MAX_REFRESH = 10
+_MIN_REFRESH = 2
+_SLOW_FRAME = 0.03
+_FAST_FRAME = 0.005
+
+_ACTION_LABELS = {
+    ResultStatus.DELETED: "[green]deleted ✓",
+    ResultStatus.ERROR: "[red]error ✗",
+    ResultStatus.SKIPPED: "[yellow]skipped △",
+}
+# Keyed by (is_dir, is_symlink); a symlink to a directory reports as a directory.
+_DIR_LABELS = {
+    (True, False): "yes",
+    (True, True): "yes",
+    (False, True): "symlink",
+    (False, False): "no",
+}
+_YES_NO = ("no", "yes")
+# Per-row fields stored by RichRenderer (every table column except Index), as
+# shown for a path that is enqueued but has no result yet; on_enqueue fills
+# in the path.
+_QUEUED_ROW = ("", "...", "...", "...", "...", "[cyan]queued", "")
+
+
 class FallbackConsole:
     """Minimal console with Rich-like API."""
 
@@ -56,6 +110,11 @@ class BaseRenderer:
     def on_enqueue(self, index: int, path: Union[Path, str]) -> None:
         raise NotImplementedError
 
+    def on_enqueue_bulk(self, items: Iterable[Tuple[int, Union[Path, str]]]) -> None:
+        """Enqueue many paths at once; renderers override this to avoid per-item work."""
+        for index, path in items:
+            self.on_enqueue(index, path)
+
     def on_result(self, result: PathResult) -> None:
         raise NotImplementedError
 
@@ -63,181 +122,302 @@ class BaseRenderer:
         raise NotImplementedError
 
 
-if HAS_RICH:
-
-    class RichRenderer(BaseRenderer):
-        """Interactive Rich renderer with live-updating table and progress."""
-
-        def __init__(self, console: Console, total: int, app_name: str = "Delete Empty Dirs") -> None:
-            self.console = console
-            self.total = total
-            self.app_name = app_name
-            self.start_time = datetime.now()
-            self._rows: Dict[int, Dict[str, str]] = {}
-            self._processed = 0
-            self._deleted = 0
-            self._skipped = 0
-            self._errors = 0
-            self._live: Optional[Live] = None
-            self._progress = Progress(
-                TextColumn("[bold blue]Progress"),
-                BarColumn(),
-                TextColumn("{task.completed}/{task.total}"),
-                TimeElapsedColumn(),
-                expand=True,
-            )
-            self._task_id = self._progress.add_task("paths", total=total)
-
-        def __enter__(self) -> "RichRenderer":
-            self._progress.start()
-            self._live = Live(self._render_layout(), refresh_per_second=10, console=self.console)
-            self._live.__enter__()
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> None:
-            if self._live:
-                self._live.__exit__(exc_type, exc, tb)
-            self._progress.stop()
-
-        def _render_header(self) -> Panel:
-            header_text = Text()
-            header_text.append(f"{self.app_name}\n", style="bold white")
-            header_text.append(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}", style="dim")
-            return Panel(header_text, style="bold green", padding=(1, 2))
-
-        def _build_table(self) -> Table:
-            table = Table(box=box.SIMPLE_HEAVY, expand=True)
-            table.add_column("Index", justify="right", style="cyan", no_wrap=True)
-            table.add_column("Path", overflow="fold")
-            table.add_column("Exists", justify="center", style="dim")
-            table.add_column("Dir", justify="center", style="dim")
-            table.add_column("Entries", justify="center")
-            table.add_column("Empty?", justify="center")
-            table.add_column("Action", justify="center")
-            table.add_column("Reason/Err", overflow="fold")
-
-            for idx in sorted(self._rows):
-                row = self._rows[idx]
-                table.add_row(
-                    str(idx + 1),
-                    row.get("path", ""),
-                    row.get("exists", ""),
-                    row.get("dir", ""),
-                    row.get("entries", ""),
-                    row.get("empty", ""),
-                    row.get("action", ""),
-                    row.get("reason", ""),
-                )
-            return table
-
-        def _build_footer(self) -> Panel:
-            remaining = max(self.total - self._processed, 0)
-            stats = Text()
-            stats.append(f"Deleted: {self._deleted}  ", style="green")
-            stats.append(f"Skipped: {self._skipped}  ", style="yellow")
-            stats.append(f"Errors: {self._errors}  ", style="red")
-            stats.append(f"Remaining: {remaining}", style="white")
-            self._progress.update(self._task_id, completed=self._processed)
-            footer_layout = Layout()
-            footer_layout.split_row(
-                Layout(self._progress, ratio=2),
-                Layout(Panel(stats, border_style="blue"), ratio=1),
-            )
-            return Panel(footer_layout, padding=0, border_style="blue")
-
-        def _render_layout(self) -> Layout:
-            layout = Layout()
-            layout.split_column(
-                Layout(self._render_header(), size=3),
-                Layout(self._build_table(), ratio=2),
-                Layout(self._build_footer(), size=5),
-            )
-            return layout
-
-        def _refresh(self) -> None:
-            if self._live:
-                self._live.update(self._render_layout(), refresh=True)
-
-        def on_enqueue(self, index: int, path: Union[Path, str]) -> None:
-            self._rows[index] = {
-                "path": str(path),
-                "exists": "...",
-                "dir": "...",
-                "entries": "...",
-                "empty": "...",
-                "action": "[cyan]queued",
-                "reason": "",
-            }
-            self._refresh()
-
-        def on_result(self, result: PathResult) -> None:
-            self._processed += 1
-            if result.status == ResultStatus.DELETED:
-                self._deleted += 1
-                action = "[green]deleted ✓"
-            elif result.status == ResultStatus.ERROR:
-                self._errors += 1
-                action = "[red]error ✗"
-            else:
-                self._skipped += 1
-                action = "[yellow]skipped △"
-
-            row = self._rows.setdefault(result.index, {})
-            row.update(
-                {
-                    "path": str(result.path),
-                    "exists": "yes" if result.exists else "no",
-                    "dir": "yes" if result.is_dir else ("symlink" if result.is_symlink else "no"),
-                    "entries": str(result.entries_count if result.entries_count >= 0 else "?"),
-                    "empty": "yes" if result.empty_verified else "no",
-                    "action": action,
-                    "reason": (result.reason.value if result.reason else "") or (result.message or ""),
-                }
-            )
-            self._refresh()
-
-        def on_complete(self, *, processed: int, deleted: int, skipped: int, errors: int, elapsed: float) -> None:
-            footer_note = Text()
-            footer_note.append(f"Processed: {processed}  ", style="bold white")
-            footer_note.append(f"Deleted: {deleted}  ", style="green")
-            footer_note.append(f"Skipped: {skipped}  ", style="yellow")
-            footer_note.append(f"Errors: {errors}  ", style="red")
-            footer_note.append(f"Elapsed: {elapsed:.2f}s", style="bold blue")
-            if self._live:
-                self._live.update(self._render_layout())
-            self.console.print(Panel(footer_note, title="Summary", border_style="green"))
-else:  # pragma: no cover - optional dependency
-    RichRenderer = None  # type: ignore
+class RichRenderer(BaseRenderer):
+    """Interactive Rich renderer with live-updating table and progress."""
+
+    def __init__(
+        self,
+        console: Console,
+        total: int,
+        app_name: str = "Delete Empty Dirs",
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        # Rich modules are imported here, on first use, rather than at module load.
+        rich = self._rich = _rich()
+        self.console = console
+        self.total = total
+        self.app_name = app_name
+        self.start_time = datetime.now()
+        # Column-major row storage indexed by path index: path, exists, dir,
+        # entries, empty, action, reason. Sized up front from ``total`` and
+        # pre-filled with the queued placeholders, so enqueueing only sets a path.
+        self._cols: List[List[str]] = [[value] * total for value in _QUEUED_ROW]
+        self._max_seen = -1
+        self._latest_done = -1
+        self._processed = 0
+        self._counts = {status: 0 for status in ResultStatus}
+        self._live: Optional[Live] = None
+        # Set by every event; a clean frame reuses the last Group. The footer's
+        # Progress still re-renders, so elapsed time keeps ticking.
+        self._dirty = True
+        self._frame: Optional[Group] = None
+        self._frame_height = -1
+        # Frame timing for the adaptive refresh rate; skipped ticks replay the
+        # segments of the last rendered frame.
+        self._clock = clock
+        self._refresh_rate = _MAX_REFRESH
+        self._frame_times: Deque[float] = deque(maxlen=20)
+        self._ticks_to_skip = 0
+        self._segments: Optional[List[Segment]] = None
+        self._segments_key: Tuple[int, Optional[int]] = (-1, None)
+        # Results queued by on_result and applied by the frame that renders them;
+        # deque append/popleft are atomic, so no lock is shared with Live's thread.
+        self._pending: Deque[PathResult] = deque()
+        self._progress = rich.Progress(
+            rich.TextColumn("[bold blue]Progress"),
+            rich.BarColumn(),
+            rich.TextColumn("{task.completed}/{task.total}"),
+            rich.TimeElapsedColumn(),
+            console=console,
+            expand=True,
+        )
+        self._task_id = self._progress.add_task("paths", total=total)
+        # Header and footer are built once; frames rebuild only the table and
+        # refresh the footer's contents in place.
+        self._header_panel = self._build_header()
+        self._columns = self._build_columns()
+        # Progress and stats each get a full-width line, so the counts are not
+        # squeezed into a side column; _update_footer swaps in fresh stats.
+        self._footer_panel = rich.Panel(rich.Group(self._progress), padding=0, border_style="blue")
+
+    def __enter__(self) -> "RichRenderer":
+        rich = self._rich
+        # Live renders the renderer itself (see __rich_console__) at
+        # refresh_per_second; events only mutate state.
+        self._live = rich.Live(get_renderable=lambda: self, refresh_per_second=_MAX_REFRESH, console=self.console)
+        self._live.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._live:
+            # The final frame, drawn when Live stops, must not be skipped.
+            self._ticks_to_skip = 0
+            self._live.__exit__(exc_type, exc, tb)
+
+    def _build_header(self) -> Panel:
+        rich = self._rich
+        header_text = rich.Text()
+        header_text.append(f"{self.app_name}\n", style="bold white")
+        header_text.append(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}", style="dim")
+        return rich.Panel(header_text, style="bold green", padding=(0, 2))
+
+    def _build_columns(self) -> Tuple[Column, ...]:
+        Column = self._rich.Column
+        # Rows must stay one line high: the row budget counts lines, and a taller
+        # frame would be cut off at the bottom, where the footer is. Every column
+        # is no_wrap; the ratios give Path and Reason/Err the leftover width so
+        # the short columns keep theirs.
+        return (
+            Column("Index", justify="right", style="cyan", no_wrap=True),
+            Column("Path", no_wrap=True, overflow="ellipsis", ratio=3),
+            Column("Exists", justify="center", style="dim", no_wrap=True),
+            Column("Dir", justify="center", style="dim", no_wrap=True),
+            Column("Entries", justify="center", no_wrap=True),
+            Column("Empty?", justify="center", no_wrap=True),
+            Column("Action", justify="center", no_wrap=True),
+            Column("Reason/Err", no_wrap=True, overflow="ellipsis", ratio=1),
+        )
+
+    def _new_table(self) -> Table:
+        """Return an empty table with copies of the prebuilt columns."""
+        rich = self._rich
+        return rich.Table(*[column.copy() for column in self._columns], box=rich.box.SIMPLE_HEAVY, expand=True)
+
+    def _build_table(self) -> Table:
+        table = self._new_table()
+        # Only the rows that fit on screen, ending at the furthest completed
+        # row, so frame cost tracks the viewport rather than the run size.
+        budget = max(self.console.size.height - _RESERVED_LINES, 1)
+        end = min(self._max_seen + 1, max(self._latest_done + 1, budget))
+        cols = self._cols
+        for idx in range(max(0, end - budget), end):
+            table.add_row(str(idx + 1), *[col[idx] for col in cols])
+        return table
+
+    def _update_footer(self) -> None:
+        rich = self._rich
+        remaining = max(self.total - self._processed, 0)
+        stats = rich.Text(no_wrap=True, overflow="ellipsis")
+        stats.append(f"Deleted: {self._counts[ResultStatus.DELETED]}  ", style="green")
+        stats.append(f"Skipped: {self._counts[ResultStatus.SKIPPED]}  ", style="yellow")
+        stats.append(f"Errors: {self._counts[ResultStatus.ERROR]}  ", style="red")
+        stats.append(f"Remaining: {remaining}", style="white")
+        self._footer_panel.renderable = rich.Group(self._progress, stats)
+
+    def _render_layout(self) -> Group:
+        height = self.console.size.height
+        if not self._dirty and self._frame is not None and height == self._frame_height:
+            return self._frame
+        # Cleared before draining so an event arriving mid-build marks the next frame.
+        self._dirty = False
+        self._drain_results()
+        self._update_footer()
+        # A plain top-to-bottom stack: the sections have fixed heights, so
+        # Layout's region splitting isn't needed.
+        self._frame = self._rich.Group(self._header_panel, self._build_table(), self._footer_panel)
+        self._frame_height = height
+        return self._frame
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        # Times the whole frame, including Rich's own measuring and rendering,
+        # which costs more than building the renderables.
+        key = (options.max_width, options.height)
+        if self._segments is not None and self._ticks_to_skip > 0 and key == self._segments_key:
+            self._ticks_to_skip -= 1
+            yield from self._segments
+            return
+        started = self._clock()
+        segments = list(console.render(self._render_layout(), options))
+        self._segments, self._segments_key = segments, key
+        self._tune_refresh(self._clock() - started)
+        yield from segments
+
+    def _tune_refresh(self, frame_time: float) -> None:
+        times = self._frame_times
+        times.append(frame_time)
+        mean = sum(times) / len(times)
+        if mean > _SLOW_FRAME:
+            self._refresh_rate = max(_MIN_REFRESH, self._refresh_rate // 2)
+        elif mean < _FAST_FRAME:
+            self._refresh_rate = min(_MAX_REFRESH, self._refresh_rate * 2)
+        self._ticks_to_skip = _MAX_REFRESH // self._refresh_rate - 1
+
+    def _drain_results(self) -> None:
+        pending = self._pending
+        if not pending:
+            return
+        while pending:
+            self._apply_result(pending.popleft())
+        # One Progress update per drained batch, however many results it held.
+        self._progress.update(self._task_id, completed=self._processed, refresh=False)
+
+    def on_enqueue(self, index: int, path: Union[Path, str]) -> None:
+        self._cols[0][index] = os.fspath(path)
+        if index > self._max_seen:
+            self._max_seen = index
+        self._dirty = True
+
+    def on_enqueue_bulk(self, items: Iterable[Tuple[int, Union[Path, str]]]) -> None:
+        paths = self._cols[0]
+        max_seen = self._max_seen
+        for index, path in items:
+            paths[index] = os.fspath(path)
+            if index > max_seen:
+                max_seen = index
+        self._max_seen = max_seen
+        self._dirty = True
+
+    def on_result(self, result: PathResult) -> None:
+        self._pending.append(result)
+        self._dirty = True
+
+    def _apply_result(self, result: PathResult) -> None:
+        # Every result's index was enqueued first (the CLI enqueues all paths
+        # before processing), so its path and _max_seen are already set. The
+        # assert checks that in debug runs and is stripped under -O.
+        index = result.index
+        assert self._cols[0][index], f"result for index {index} arrived before on_enqueue"
+        self._processed += 1
+        if index > self._latest_done:
+            self._latest_done = index
+        self._counts[result.status] += 1
+        _, exists, is_dir, entries, empty, action, reason = self._cols
+        exists[index] = _YES_NO[result.exists]
+        is_dir[index] = _DIR_LABELS[result.is_dir, result.is_symlink]
+        entries[index] = str(result.entries_count) if result.entries_count >= 0 else "?"
+        empty[index] = _YES_NO[result.empty_verified]
+        action[index] = _ACTION_LABELS[result.status]
+        reason[index] = (result.reason.value if result.reason else "") or (result.message or "")
+
+    def on_complete(self, *, processed: int, deleted: int, skipped: int, errors: int, elapsed: float) -> None:
+        rich = self._rich
+        footer_note = rich.Text()
+        footer_note.append(f"Processed: {processed}  ", style="bold white")
+        footer_note.append(f"Deleted: {deleted}  ", style="green")
+        footer_note.append(f"Skipped: {skipped}  ", style="yellow")
+        footer_note.append(f"Errors: {errors}  ", style="red")
+        footer_note.append(f"Elapsed: {elapsed:.2f}s", style="bold blue")
+        # No refresh here: Live draws its final frame when __exit__ stops it.
+        self.console.print(rich.Panel(footer_note, title="Summary", border_style="green"))
+
+
+_PLAIN_SYMBOLS = {
+    ResultStatus.DELETED: "[green]deleted",
+    ResultStatus.ERROR: "[red]error",
+    ResultStatus.SKIPPED: "[yellow]skipped",
+}
 
 
 class PlainRenderer(BaseRenderer):
-    """Line-by-line output intended for non-TTY usage."""
+    """Line-by-line output intended for non-TTY usage.
+
+    Lines are batched and written once ``FLUSH_LINES`` are buffered, on exit,
+    and at the latest ``FLUSH_INTERVAL`` seconds after the first buffered line:
+    a timer handles the deadline, so lines still appear while the next path
+    blocks.
+    """
+
+    FLUSH_LINES = 256
+    FLUSH_INTERVAL = 0.5
 
     def __init__(self, console, verbosity: int = 0) -> None:
         self.console = console
         self.verbosity = verbosity
+        self._lines: List[str] = []
+        # Guards _lines and console writes; the deadline timer flushes from its own thread.
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+    def _emit(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) >= self.FLUSH_LINES:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write buffered lines in a single console call."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._lines:
+            # Separate arguments keep each line's markup independent.
+            self.console.print(*self._lines, sep="\n")
+            self._lines.clear()
 
     def on_enqueue(self, index: int, path: Union[Path, str]) -> None:
         if self.verbosity > 0:
-            self.console.print(f"[queued] {index+1}\t{path}")
+            self._emit(f"[queued] {index+1}\t{path}")
+
+    def on_enqueue_bulk(self, items: Iterable[Tuple[int, Union[Path, str]]]) -> None:
+        if self.verbosity > 0:
+            super().on_enqueue_bulk(items)
 
     def on_result(self, result: PathResult) -> None:
-        symbol = {
-            ResultStatus.DELETED: "[green]deleted",
-            ResultStatus.ERROR: "[red]error",
-            ResultStatus.SKIPPED: "[yellow]skipped",
-        }[result.status]
-        extras = []
-        if result.reason:
-            extras.append(result.reason.value)
-        if result.message:
-            extras.append(result.message)
-        detail = " | ".join(extras)
         if self.verbosity <= -1 and result.status == ResultStatus.SKIPPED:
             return
-        self.console.print(f"{symbol}\t{result.path}\t{detail}")
+        reason, message = result.reason, result.message
+        if reason and message:
+            detail = f"{reason.value} | {message}"
+        elif reason:
+            detail = reason.value
+        else:
+            detail = message or ""
+        self._emit(f"{_PLAIN_SYMBOLS[result.status]}\t{result.path}\t{detail}")
 
     def on_complete(self, *, processed: int, deleted: int, skipped: int, errors: int, elapsed: float) -> None:
+        self.flush()
         self.console.print(
             f"Summary: processed={processed} deleted={deleted} skipped={skipped} errors={errors} elapsed={elapsed:.2f}s"
         )
@@ -250,8 +430,11 @@ def create_renderer(
     total: int,
     verbosity: int,
 ) -> BaseRenderer:
-    """Factory returning a renderer appropriate for the current environment."""
-    if use_rich and HAS_RICH:
+    """Factory returning a renderer appropriate for the current environment.
+
+    The live UI is only used on a terminal; redirected output gets plain lines.
+    """
+    if use_rich and HAS_RICH and getattr(console, "is_terminal", False) and _rich() is not None:
         return RichRenderer(console=console, total=total)
     return PlainRenderer(console=console, verbosity=verbosity)
 
@@ -259,5 +442,7 @@ def create_renderer(
 def make_console():
     """Return a Console-compatible object."""
     if HAS_RICH:
+        from rich.console import Console
+
         return Console()
     return FallbackConsole()
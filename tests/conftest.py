@@ -1,12 +1,7 @@
+import os.path
 import sys
-from pathlib import Path
 
-
-def _ensure_src_on_path() -> None:
-    root = Path(__file__).resolve().parents[1]
-    src_dir = root / "src"
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
-
-_ensure_src_on_path()
+# Plain string joins avoid Path.resolve(), which lstats every parent directory.
+_SRC = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
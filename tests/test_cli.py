@@ -1,26 +1,42 @@
 import json
-import os
-import subprocess
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
 
-def _run_cli(args, cwd: Path) -> subprocess.CompletedProcess[str]:
-    env = os.environ.copy()
-    src_dir = Path(__file__).resolve().parents[1] / "src"
-    env["PYTHONPATH"] = str(src_dir)
-    cmd = [sys.executable, "-m", "delete_empty_dirs.cli", *args]
-    return subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, text=True)
+from delete_empty_dirs.cli import main
 
 
-def test_cli_deletes_empty_directory(tmp_path: Path) -> None:
+@pytest.fixture
+def run_cli(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    """Run the CLI in-process from ``cwd`` and capture its output.
+
+    ``main()`` is called without arguments so it parses the patched ``sys.argv``
+    exactly as the console script does.
+    """
+
+    def _run(args, cwd: Path) -> SimpleNamespace:
+        monkeypatch.chdir(cwd)
+        monkeypatch.setattr(sys, "argv", ["delete-empty-dirs", *args])
+        try:
+            returncode = main()
+        except SystemExit as exc:
+            returncode = exc.code or 0
+        out, err = capsys.readouterr()
+        return SimpleNamespace(returncode=returncode, stdout=out, stderr=err)
+
+    return _run
+
+
+def test_cli_deletes_empty_directory(tmp_path: Path, run_cli) -> None:
     empty_dir = tmp_path / "empty_dir"
     empty_dir.mkdir()
     full_dir = tmp_path / "full_dir"
     full_dir.mkdir()
     (full_dir / "file.txt").write_text("data", encoding="utf-8")
 
-    result = _run_cli(
+    result = run_cli(
         [str(empty_dir), str(full_dir), "--no-rich", "--no-log"],
         cwd=tmp_path,
     )
@@ -31,7 +47,7 @@ def test_cli_deletes_empty_directory(tmp_path: Path) -> None:
     assert full_dir.exists()
 
 
-def test_cli_reads_paths_from_file_and_outputs_json(tmp_path: Path) -> None:
+def test_cli_reads_paths_from_file_and_outputs_json(tmp_path: Path, run_cli) -> None:
     empty_one = tmp_path / "a"
     empty_two = tmp_path / "b"
     empty_one.mkdir()
@@ -39,7 +55,7 @@ def test_cli_reads_paths_from_file_and_outputs_json(tmp_path: Path) -> None:
     path_file = tmp_path / "paths.txt"
     path_file.write_text(f"{empty_one}\n{empty_two}\n", encoding="utf-8")
 
-    result = _run_cli(
+    result = run_cli(
         ["--from-file", str(path_file), "--no-rich", "--no-log", "--json"],
         cwd=tmp_path,
     )
@@ -51,3 +67,37 @@ def test_cli_reads_paths_from_file_and_outputs_json(tmp_path: Path) -> None:
     summary = json.loads(summary_line)
     assert summary["deleted"] == 2
     assert summary["errors"] == 0
+
+
+def test_cli_writes_jsonl_log(tmp_path: Path, run_cli) -> None:
+    empty_dir = tmp_path / "empty_dir"
+    empty_dir.mkdir()
+    missing = tmp_path / "missing"
+    log_path = tmp_path / "logs" / "run.jsonl"
+
+    result = run_cli(
+        [str(empty_dir), str(missing), "--no-rich", "--log", str(log_path)],
+        cwd=tmp_path,
+    )
+
+    assert result.returncode == 0, result.stderr + result.stdout
+    records = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    by_path = {record["path"]: record for record in records}
+    assert by_path[str(empty_dir)]["status"] == "deleted"
+    assert by_path[str(empty_dir)]["empty_verified"] is True
+    assert by_path[str(missing)]["reason"] == "not_exists"
+
+
+def test_cli_dedupes_equivalent_paths(tmp_path: Path, run_cli) -> None:
+    empty_dir = tmp_path / "empty_dir"
+    empty_dir.mkdir()
+
+    result = run_cli(
+        [str(empty_dir), "empty_dir", "./empty_dir/", "--no-rich", "--no-log", "--json"],
+        cwd=tmp_path,
+    )
+
+    assert result.returncode == 0, result.stderr + result.stdout
+    summary = json.loads(result.stdout.strip().splitlines()[-1])
+    assert summary["total"] == 1
+    assert summary["deleted"] == 1
@@ -7,7 +7,13 @@ from delete_empty_dirs.core import ExecutionSettings, normalise_path, process_pa
 from delete_empty_dirs.models import ResultStatus, SkipReason
 
 
-def make_settings(tmp_path: Path, *, follow_symlinks: bool = False, restrict_to: tuple[Path, ...] = ()) -> ExecutionSettings:
+def make_settings(
+    tmp_path: Path,
+    *,
+    follow_symlinks: bool = False,
+    restrict_to: tuple[Path, ...] = (),
+    allow_roots: tuple[Path, ...] = (),
+) -> ExecutionSettings:
     protected = {tmp_path, Path.home()}
     if os.name == "nt":
         anchor = tmp_path.anchor or Path.home().anchor
@@ -18,12 +24,34 @@ def make_settings(tmp_path: Path, *, follow_symlinks: bool = False, restrict_to:
     return ExecutionSettings(
         follow_symlinks=follow_symlinks,
         restrict_to=restrict_to,
-        allow_roots=(),
+        allow_roots=allow_roots,
         protected_roots=tuple(protected),
         repo_root=tmp_path,
     )
 
 
+@pytest.fixture(scope="session")
+def readonly_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared tree for tests that only expect skips; built once per session.
+
+    Tests using it must never expect a deletion, since nothing is recreated
+    between tests.
+    """
+    root = tmp_path_factory.mktemp("readonly")
+    (root / "non_empty").mkdir()
+    (root / "non_empty" / "file.txt").write_text("content")
+    (root / "hidden").mkdir()
+    (root / "hidden" / ".DS_Store").write_text("")
+    (root / "file.txt").write_text("content")
+    (root / "target").mkdir()
+    (root / "target" / "keep.txt").write_text("")
+    try:
+        os.symlink(root / "target", root / "link", target_is_directory=True)
+    except (AttributeError, NotImplementedError, OSError):
+        pass
+    return root
+
+
 def test_process_empty_directory_deleted(tmp_path: Path) -> None:
     target = tmp_path / "empty"
     target.mkdir()
@@ -37,11 +65,9 @@ def test_process_empty_directory_deleted(tmp_path: Path) -> None:
     assert totals.deleted == 1
 
 
-def test_process_non_empty_directory_skipped(tmp_path: Path) -> None:
-    target = tmp_path / "non_empty"
-    target.mkdir()
-    (target / "file.txt").write_text("content")
-    settings = make_settings(tmp_path)
+def test_process_non_empty_directory_skipped(readonly_tree: Path) -> None:
+    target = readonly_tree / "non_empty"
+    settings = make_settings(readonly_tree)
 
     results, totals, _ = process_paths([target], settings, workers=1)
 
@@ -51,6 +77,19 @@ def test_process_non_empty_directory_skipped(tmp_path: Path) -> None:
     assert totals.skipped == 1
 
 
+@pytest.mark.parametrize("follow_symlinks", [False, True])
+def test_regular_file_skipped_as_not_dir(readonly_tree: Path, follow_symlinks: bool) -> None:
+    target = readonly_tree / "file.txt"
+    settings = make_settings(readonly_tree, follow_symlinks=follow_symlinks)
+
+    results, totals, _ = process_paths([target], settings, workers=1)
+
+    assert results[0].status == ResultStatus.SKIPPED
+    assert results[0].reason == SkipReason.NOT_DIR
+    assert target.exists()
+    assert totals.skipped == 1
+
+
 def test_restrict_policy_blocks(tmp_path: Path) -> None:
     outside = tmp_path / "outside"
     outside.mkdir()
@@ -65,18 +104,49 @@ def test_restrict_policy_blocks(tmp_path: Path) -> None:
     assert totals.skipped == 1
 
 
-def test_symlink_refused_without_follow(tmp_path: Path) -> None:
-    target = tmp_path / "target"
-    link = tmp_path / "link"
-    target.mkdir()
-    try:
-        os.symlink(target, link, target_is_directory=True)
-    except (AttributeError, NotImplementedError):
+def test_restrict_policy_allows_subtree_but_not_sibling_prefix(tmp_path: Path) -> None:
+    restrict_root = tmp_path / "allowed"
+    inside = restrict_root / "child"
+    sibling = tmp_path / "allowed_sibling"
+    inside.mkdir(parents=True)
+    sibling.mkdir()
+    settings = make_settings(tmp_path, restrict_to=(restrict_root,))
+
+    results, _, _ = process_paths([inside, sibling], settings, workers=1)
+    by_path = {res.path: res for res in results}
+
+    assert by_path[inside].status == ResultStatus.DELETED
+    assert by_path[sibling].reason == SkipReason.POLICY_BLOCKED
+    assert sibling.exists()
+
+
+def test_protected_root_skipped_unless_allowed(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    settings = make_settings(repo_root)
+
+    results, totals, _ = process_paths([repo_root], settings, workers=1)
+
+    assert results[0].status == ResultStatus.SKIPPED
+    assert results[0].reason == SkipReason.PROTECTED_ROOT
+    assert repo_root.exists()
+    assert totals.skipped == 1
+
+    allowed = make_settings(repo_root, allow_roots=(repo_root,))
+    results, totals, _ = process_paths([repo_root], allowed, workers=1)
+
+    assert results[0].status == ResultStatus.DELETED
+    assert not repo_root.exists()
+    assert totals.deleted == 1
+
+
+def test_symlink_refused_without_follow(readonly_tree: Path) -> None:
+    target = readonly_tree / "target"
+    link = readonly_tree / "link"
+    if not link.is_symlink():
         pytest.skip("Symlinks not supported on this platform")
-    except OSError as exc:
-        pytest.skip(f"Symlink creation failed: {exc}")
 
-    settings = make_settings(tmp_path, follow_symlinks=False)
+    settings = make_settings(readonly_tree, follow_symlinks=False)
     results, totals, _ = process_paths([link], settings, workers=1)
 
     assert results[0].status == ResultStatus.SKIPPED
@@ -110,3 +180,80 @@ def test_normalise_path_expands_user(tmp_path: Path, monkeypatch: pytest.MonkeyP
     monkeypatch.setenv("HOME", str(fake_home))
     path = normalise_path("~/example")
     assert str(path).startswith(str(fake_home))
+
+
+def test_normalise_path_expands_env_vars(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DED_TEST_ROOT", str(tmp_path))
+    path = normalise_path("$DED_TEST_ROOT/example")
+    assert path == tmp_path / "example"
+
+
+def test_normalise_path_uses_supplied_cwd(tmp_path: Path) -> None:
+    path = normalise_path("nested/../child", str(tmp_path))
+    assert path == tmp_path / "child"
+
+
+def test_hidden_file_counts_as_content(readonly_tree: Path) -> None:
+    target = readonly_tree / "hidden"
+    settings = make_settings(readonly_tree)
+
+    results, _, _ = process_paths([target], settings, workers=1)
+
+    assert results[0].reason == SkipReason.NOT_EMPTY
+    assert results[0].entries_count == 1
+    assert target.exists()
+
+
+def test_process_many_paths_with_worker_pool(tmp_path: Path) -> None:
+    targets = [tmp_path / f"empty_{idx}" for idx in range(20)]
+    for target in targets:
+        target.mkdir()
+    settings = make_settings(tmp_path)
+
+    results, totals, _ = process_paths(targets, settings, workers=3)
+
+    assert sorted(res.index for res in results) == list(range(len(targets)))
+    assert totals.deleted == len(targets)
+    assert not any(target.exists() for target in targets)
+
+
+def test_symlink_chain_follow_deletes_final_target(tmp_path: Path) -> None:
+    target = tmp_path / "chain_target"
+    middle = tmp_path / "chain_middle"
+    link = tmp_path / "chain_link"
+    target.mkdir()
+    try:
+        os.symlink(target, middle, target_is_directory=True)
+        os.symlink("chain_middle", link, target_is_directory=True)
+    except (AttributeError, NotImplementedError):
+        pytest.skip("Symlinks not supported on this platform")
+    except OSError as exc:
+        pytest.skip(f"Symlink creation failed: {exc}")
+
+    settings = make_settings(tmp_path, follow_symlinks=True)
+    results, totals, _ = process_paths([link], settings, workers=1)
+
+    assert results[0].status == ResultStatus.DELETED
+    assert not target.exists()
+    assert middle.is_symlink()
+    assert totals.deleted == 1
+
+
+def test_relative_symlink_follow_reports_canonical_target(tmp_path: Path) -> None:
+    target = tmp_path / "real" / "t"
+    target.mkdir(parents=True)
+    (tmp_path / "links").mkdir()
+    link = tmp_path / "links" / "lnk"
+    try:
+        os.symlink(os.path.join("..", "real", "t"), link, target_is_directory=True)
+    except (AttributeError, NotImplementedError):
+        pytest.skip("Symlinks not supported on this platform")
+    except OSError as exc:
+        pytest.skip(f"Symlink creation failed: {exc}")
+
+    settings = make_settings(tmp_path, follow_symlinks=True, restrict_to=(tmp_path / "real",))
+    results, _, _ = process_paths([link], settings, workers=1)
+
+    assert results[0].status == ResultStatus.DELETED
+    assert results[0].message == f"Deleted symlink target: {os.path.realpath(target)}"
+    assert not target.exists()
@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from delete_empty_dirs import logging_utils
+from delete_empty_dirs.logging_utils import JsonlLogger
+
+
+def read_records(path: Path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_writer_persists_every_queued_record_on_close(tmp_path: Path) -> None:
+    log_path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(log_path)
+    logger.start_writer()
+    for idx in range(1000):
+        logger.write({"idx": idx})
+    logger.close()
+
+    assert [record["idx"] for record in read_records(log_path)] == list(range(1000))
+
+
+def test_flush_during_writer_run_loses_no_records(tmp_path: Path) -> None:
+    log_path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(log_path)
+    logger.start_writer()
+    stop = threading.Event()
+
+    def keep_flushing() -> None:
+        while not stop.is_set():
+            logger.flush()
+
+    flusher = threading.Thread(target=keep_flushing)
+    flusher.start()
+    try:
+        for idx in range(20000):
+            logger.write({"idx": idx})
+    finally:
+        stop.set()
+        flusher.join()
+    logger.close()
+
+    assert len(read_records(log_path)) == 20000
+
+
+def test_writer_error_is_raised_from_next_write(tmp_path: Path) -> None:
+    logger = JsonlLogger(tmp_path / "run.jsonl")
+    logger.start_writer()
+    logger.write({"bad": object()})
+
+    deadline = time.monotonic() + 5
+    with pytest.raises(TypeError):
+        while time.monotonic() < deadline:
+            logger.write({"ok": True})
+            time.sleep(0.001)
+    with pytest.raises(TypeError):
+        logger.close()
+
+
+def test_writer_error_is_raised_from_close(tmp_path: Path) -> None:
+    log_path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(log_path)
+    logger.start_writer()
+    logger.write({"idx": 0})
+    logger.write({"bad": object()})
+
+    with pytest.raises(TypeError):
+        logger.close()
+    assert read_records(log_path) == [{"idx": 0}]
+
+
+def test_flush_with_writer_raises_writer_error(tmp_path: Path) -> None:
+    logger = JsonlLogger(tmp_path / "run.jsonl")
+    logger.start_writer()
+    logger.write({"bad": object()})
+
+    with pytest.raises(TypeError):
+        logger.flush()
+    with pytest.raises(TypeError):
+        logger.close()
+
+
+@pytest.fixture
+def fsync_calls(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls: list = []
+    monkeypatch.setattr(logging_utils.os, "fsync", calls.append)
+    return calls
+
+
+def test_records_are_buffered_until_record_limit(tmp_path: Path, fsync_calls: list) -> None:
+    log_path = tmp_path / "run.jsonl"
+    with JsonlLogger(log_path) as logger:
+        for idx in range(logging_utils.FLUSH_EVERY_RECORDS - 1):
+            logger.write({"idx": idx})
+        assert log_path.read_bytes() == b""
+
+        logger.write({"idx": logging_utils.FLUSH_EVERY_RECORDS - 1})
+        assert len(read_records(log_path)) == logging_utils.FLUSH_EVERY_RECORDS
+        assert fsync_calls == []
+
+
+def test_records_are_flushed_at_byte_limit(tmp_path: Path, fsync_calls: list) -> None:
+    log_path = tmp_path / "run.jsonl"
+    with JsonlLogger(log_path) as logger:
+        logger.write({"blob": "x" * logging_utils.FLUSH_EVERY_BYTES})
+        assert len(read_records(log_path)) == 1
+        assert fsync_calls == []
+
+
+def test_fsync_every_syncs_after_n_records(tmp_path: Path, fsync_calls: list) -> None:
+    log_path = tmp_path / "run.jsonl"
+    with JsonlLogger(log_path, fsync_every=3) as logger:
+        logger.write({"idx": 0})
+        logger.write({"idx": 1})
+        assert fsync_calls == []
+
+        logger.write({"idx": 2})
+        assert len(fsync_calls) == 1
+        assert len(read_records(log_path)) == 3
+
+
+def test_close_flushes_and_fsyncs(tmp_path: Path, fsync_calls: list) -> None:
+    log_path = tmp_path / "run.jsonl"
+    logger = JsonlLogger(log_path)
+    logger.open()
+    logger.write({"idx": 0})
+    assert fsync_calls == []
+
+    logger.close()
+    assert len(fsync_calls) == 1
+    assert read_records(log_path) == [{"idx": 0}]
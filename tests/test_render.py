@@ -0,0 +1,137 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from delete_empty_dirs.models import PathResult, ResultStatus
+from delete_empty_dirs.render import HAS_RICH, RichRenderer, create_renderer
+
+pytestmark = pytest.mark.skipif(not HAS_RICH, reason="Rich not installed")
+
+
+def make_rich_renderer(total: int, height: int = 30):
+    from rich.console import Console
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=120, height=height)
+    return create_renderer(console=console, use_rich=True, total=total, verbosity=0)
+
+
+def test_rich_table_is_windowed_to_latest_results() -> None:
+    total = 200
+    renderer = make_rich_renderer(total)
+    renderer.on_enqueue_bulk((idx, Path(f"/data/dir_{idx}")) for idx in range(total))
+    for idx in range(150):
+        renderer.on_result(PathResult(index=idx, path=Path(f"/data/dir_{idx}"), status=ResultStatus.DELETED))
+
+    renderer._drain_results()
+    table = renderer._build_table()
+    renderer.console.print(table)
+    rendered = renderer.console.file.getvalue()
+
+    assert 0 < table.row_count < total
+    assert "/data/dir_149 " in rendered
+    assert "/data/dir_150 " not in rendered
+    assert "/data/dir_0 " not in rendered
+
+
+def test_rich_frame_with_long_paths_keeps_full_footer_on_screen() -> None:
+    from rich.console import Console
+
+    total, height = 100, 30
+    renderer = make_rich_renderer(total, height=height)
+    long_path = "/data/" + "nested_directory_name/" * 6
+    renderer.on_enqueue_bulk((idx, Path(f"{long_path}{idx}")) for idx in range(total))
+    for idx in range(40):
+        renderer.on_result(
+            PathResult(index=idx, path=Path(f"{long_path}{idx}"), status=ResultStatus.ERROR, message="x" * 100)
+        )
+
+    console = Console(file=io.StringIO(), width=80, height=height, color_system=None)
+    renderer.console = console
+    console.print(renderer._render_layout())
+    lines = console.file.getvalue().splitlines()
+
+    # Live crops anything taller than the screen from the bottom, so the
+    # frame must fit for the footer to be visible mid-run.
+    assert len(lines) <= height
+    assert any("Progress" in line for line in lines)
+    assert any("Errors: 40  Remaining: 60" in line for line in lines)
+
+
+def test_rich_frame_is_reused_until_state_changes() -> None:
+    renderer = make_rich_renderer(2)
+    renderer.on_enqueue_bulk((idx, Path(f"/data/dir_{idx}")) for idx in range(2))
+
+    first = renderer._render_layout()
+    assert renderer._render_layout() is first
+
+    renderer.on_result(PathResult(index=0, path=Path("/data/dir_0"), status=ResultStatus.DELETED))
+    assert renderer._render_layout() is not first
+
+
+def test_rich_refresh_rate_adapts_to_frame_time() -> None:
+    from rich.console import Console
+
+    frame_time = 0.1
+    now = [0.0]
+
+    def clock() -> float:
+        # Each reading advances by frame_time, so every rendered frame measures that long.
+        now[0] += frame_time
+        return now[0]
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=120, height=30)
+    renderer = RichRenderer(console=console, total=10, clock=clock)
+    renderer.on_enqueue_bulk((idx, Path(f"/data/dir_{idx}")) for idx in range(10))
+
+    for _ in range(3):
+        console.print(renderer)
+    assert renderer._refresh_rate == 2
+
+    # While the rate is lowered, ticks replay the last frame instead of rendering.
+    renderer.on_result(PathResult(index=0, path=Path("/data/dir_0"), status=ResultStatus.DELETED))
+    console.print(renderer)
+    assert renderer._processed == 0
+
+    frame_time = 0.001
+    for _ in range(200):
+        console.print(renderer)
+    assert renderer._refresh_rate == 10
+    assert renderer._processed == 1
+
+
+def test_rich_requested_on_non_terminal_falls_back_to_plain() -> None:
+    from rich.console import Console
+
+    from delete_empty_dirs.render import PlainRenderer
+
+    console = Console(file=io.StringIO(), force_terminal=False)
+    renderer = create_renderer(console=console, use_rich=True, total=1, verbosity=0)
+
+    assert isinstance(renderer, PlainRenderer)
+
+
+def test_plain_renderer_flushes_buffered_lines_after_deadline() -> None:
+    import time
+
+    from delete_empty_dirs.render import PlainRenderer
+
+    class RecordingConsole:
+        def __init__(self) -> None:
+            self.printed: list = []
+
+        def print(self, *lines, **kwargs) -> None:
+            self.printed.extend(lines)
+
+    console = RecordingConsole()
+    renderer = PlainRenderer(console=console)
+    renderer.FLUSH_INTERVAL = 0.05
+    renderer.on_result(PathResult(index=0, path=Path("/data/dir_0"), status=ResultStatus.DELETED))
+    assert console.printed == []
+
+    # No further events: the deadline timer alone must write the line.
+    deadline = time.monotonic() + 5
+    while not console.printed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(console.printed) == 1
+    assert "/data/dir_0" in console.printed[0]